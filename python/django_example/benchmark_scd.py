@@ -1,5 +1,7 @@
 import sys
 import os
+import csv
+import io
 import django
 import datetime
 import time
@@ -9,6 +11,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'myproject.settings')
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 django.setup()
 
+from django.db import connection, transaction
 from django_example.models import Job, Timelog, PaymentLineItem
 from django_example.repos import (
     find_active_jobs_by_company,
@@ -17,67 +20,91 @@ from django_example.repos import (
     find_line_items_by_contractor_and_period,
 )
 
+class _CSVRowStream(io.RawIOBase):
+    """Read-only byte stream that renders rows as CSV lines on demand."""
+
+    def __init__(self, row_iter):
+        self._rows = iter(row_iter)
+        self._line = io.StringIO()
+        self._writer = csv.writer(self._line, lineterminator="\n")
+        self._pending = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while len(self._pending) < len(b):
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(row)
+            self._pending += self._line.getvalue().encode("utf-8")
+            self._line.seek(0)
+            self._line.truncate()
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+def copy_rows(table, cols, row_iter):
+    buf = io.TextIOWrapper(io.BufferedReader(_CSVRowStream(row_iter)), encoding="utf-8")
+    statement = f"COPY {table} ({','.join(cols)}) FROM STDIN WITH (FORMAT CSV)"
+    with connection.cursor() as cursor:
+        # Django uses psycopg 3 when it is installed, which replaces copy_expert
+        # with the cursor.copy() context manager
+        if hasattr(cursor.cursor, "copy"):
+            with cursor.cursor.copy(statement) as copy:
+                while chunk := buf.read(65536):
+                    copy.write(chunk)
+        else:
+            cursor.copy_expert(statement, buf)
+
 def seed_data(n=100000):
     print(f"Seeding {n} jobs, timelogs, and payment line items...")
-    Job.objects.all().delete()
-    Timelog.objects.all().delete()
-    PaymentLineItem.objects.all().delete()
-    jobs = []
-    timelogs = []
-    plis = []
+    # A queryset delete() would load every Job to cascade through the foreign
+    # keys; truncating the tables clears them without instantiating any rows.
+    with connection.cursor() as cursor:
+        tables = ", ".join(m._meta.db_table for m in (PaymentLineItem, Timelog, Job))
+        cursor.execute(f"TRUNCATE {tables}")
     now = datetime.datetime.now()
-    for i in range(n):
-        job_uid = f"job-uid-{i}"
-        job = Job(
-            uid=job_uid,
-            id=f"job{i}",
-            version=1,
-            status="active",
-            rate=100,
-            title="Engineer",
-            company_id="comp1",
-            contractor_id="cont1"
+    time_start = now - datetime.timedelta(hours=2)
+    time_end = now - datetime.timedelta(hours=1)
+    # UIDs are deterministic, so foreign keys are written straight from the
+    # row index instead of refetching the parent rows.
+    with transaction.atomic():
+        copy_rows(
+            Job._meta.db_table,
+            ("uid", "id", "version", "status", "rate", "title", "company_id", "contractor_id"),
+            (
+                (f"job-uid-{i}", f"job{i}", 1, "active", 100, "Engineer", "comp1", "cont1")
+                for i in range(n)
+            ),
         )
-        jobs.append(job)
-    Job.objects.bulk_create(jobs, batch_size=1000)
-    jobs = {job.uid: job for job in Job.objects.filter(company_id="comp1")}
-    for i in range(n):
-        job_uid = f"job-uid-{i}"
-        timelog_uid = f"tl-uid-{i}"
-        timelog = Timelog(
-            uid=timelog_uid,
-            id=f"tl{i}",
-            version=1,
-            duration=8,
-            time_start=now - datetime.timedelta(hours=2),
-            time_end=now - datetime.timedelta(hours=1),
-            type="work",
-            job=jobs[job_uid]
+        copy_rows(
+            Timelog._meta.db_table,
+            ("uid", "id", "version", "duration", "time_start", "time_end", "type", "job_uid"),
+            (
+                (f"tl-uid-{i}", f"tl{i}", 1, 8, time_start, time_end, "work", f"job-uid-{i}")
+                for i in range(n)
+            ),
         )
-        timelogs.append(timelog)
-    Timelog.objects.bulk_create(timelogs, batch_size=1000)
-    timelogs = {tl.uid: tl for tl in Timelog.objects.filter(job__company_id="comp1")}
-    for i in range(n):
-        job_uid = f"job-uid-{i}"
-        timelog_uid = f"tl-uid-{i}"
-        pli = PaymentLineItem(
-            uid=f"pli-uid-{i}",
-            id=f"pli{i}",
-            version=1,
-            job=jobs[job_uid],
-            timelog=timelogs[timelog_uid],
-            amount=800,
-            status="pending"
+        copy_rows(
+            PaymentLineItem._meta.db_table,
+            ("uid", "id", "version", "job_uid", "timelog_uid", "amount", "status"),
+            (
+                (f"pli-uid-{i}", f"pli{i}", 1, f"job-uid-{i}", f"tl-uid-{i}", 800, "pending")
+                for i in range(n)
+            ),
         )
-        plis.append(pli)
-    PaymentLineItem.objects.bulk_create(plis, batch_size=1000)
     print("Seeding complete.")
 
 def benchmark_query(label, func, *args):
     start = time.time()
-    result = list(func(*args))
+    # Stream rows in chunks through a server-side cursor instead of
+    # materializing the whole result set at once
+    count = sum(1 for _ in func(*args).iterator(chunk_size=10000))
     elapsed = time.time() - start
-    print(f"{label}: {elapsed:.4f}s, {len(result)} results")
+    print(f"{label}: {elapsed:.4f}s, {count} results")
     return elapsed
 
 if __name__ == "__main__":
@@ -0,0 +1,79 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_example', '0002_remove_job_created_at_remove_job_updated_at_and_more'),
+    ]
+
+    operations = [
+        # Plain views rather than materialized ones, so latest-version reads always
+        # see the current base tables without any refresh
+        migrations.RunSQL(
+            sql=[
+                "CREATE VIEW jobs_latest AS "
+                "SELECT DISTINCT ON (id) * FROM jobs ORDER BY id, version DESC",
+                "CREATE VIEW timelogs_latest AS "
+                "SELECT DISTINCT ON (id) * FROM timelogs ORDER BY id, version DESC",
+                "CREATE VIEW payment_line_items_latest AS "
+                "SELECT DISTINCT ON (id) * FROM payment_line_items ORDER BY id, version DESC",
+            ],
+            reverse_sql=[
+                "DROP VIEW payment_line_items_latest",
+                "DROP VIEW timelogs_latest",
+                "DROP VIEW jobs_latest",
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobLatest',
+            fields=[
+                ('uid', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('id', models.CharField(max_length=64)),
+                ('version', models.IntegerField()),
+                ('status', models.CharField(max_length=32)),
+                ('rate', models.FloatField()),
+                ('title', models.CharField(max_length=255)),
+                ('company_id', models.CharField(max_length=64)),
+                ('contractor_id', models.CharField(max_length=64)),
+            ],
+            options={
+                'db_table': 'jobs_latest',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TimelogLatest',
+            fields=[
+                ('uid', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('id', models.CharField(max_length=64)),
+                ('version', models.IntegerField()),
+                ('duration', models.FloatField()),
+                ('time_start', models.DateTimeField()),
+                ('time_end', models.DateTimeField()),
+                ('type', models.CharField(max_length=32)),
+                ('job', models.ForeignKey(db_column='job_uid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='django_example.job')),
+            ],
+            options={
+                'db_table': 'timelogs_latest',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PaymentLineItemLatest',
+            fields=[
+                ('uid', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('id', models.CharField(max_length=64)),
+                ('version', models.IntegerField()),
+                ('amount', models.FloatField()),
+                ('status', models.CharField(max_length=32)),
+                ('job', models.ForeignKey(db_column='job_uid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='django_example.job')),
+                ('timelog', models.ForeignKey(db_column='timelog_uid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='django_example.timelog')),
+            ],
+            options={
+                'db_table': 'payment_line_items_latest',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-15 01:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_example', '0003_latest_views'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['id', '-version'], include=('uid', 'status', 'rate', 'title', 'company_id', 'contractor_id'), name='jobs_id_version_desc'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['contractor_id'], name='jobs_contractor_id'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentlineitem',
+            index=models.Index(fields=['id', '-version'], name='pli_id_version_desc'),
+        ),
+        migrations.AddIndex(
+            model_name='timelog',
+            index=models.Index(fields=['id', '-version'], name='timelogs_id_version_desc'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 
+from .scd.scd_helpers import register_latest_view
+
 
 class Job(models.Model):
     uid = models.CharField(max_length=64, unique=True, primary_key=True)
@@ -13,6 +15,17 @@ class Job(models.Model):
 
     class Meta:
         db_table = 'jobs'
+        indexes = [
+            # Latest-version lookups read straight from the index
+            models.Index(
+                fields=['id', '-version'],
+                include=['uid', 'status', 'rate', 'title', 'company_id', 'contractor_id'],
+                name='jobs_id_version_desc',
+            ),
+            # The period finders join the latest timelogs/line items to jobs and
+            # filter on contractor_id alone, with no status predicate
+            models.Index(fields=['contractor_id'], name='jobs_contractor_id'),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.uid})"
@@ -37,6 +50,10 @@ class Timelog(models.Model):
 
     class Meta:
         db_table = 'timelogs'
+        indexes = [
+            # Read in order by the DISTINCT ON in the timelogs_latest view
+            models.Index(fields=['id', '-version'], name='timelogs_id_version_desc'),
+        ]
 
     def __str__(self):
         return f"Timelog {self.uid}"
@@ -65,6 +82,91 @@ class PaymentLineItem(models.Model):
     
     class Meta:
         db_table = 'payment_line_items'
+        indexes = [
+            # Read in order by the DISTINCT ON in the payment_line_items_latest view
+            models.Index(fields=['id', '-version'], name='pli_id_version_desc'),
+        ]
+
+    def __str__(self):
+        return f"PaymentLineItem {self.uid}"
+
+# Read-side models over the "latest version" views created in migration 0003.
+# They are plain views, so reads always see the current base tables.
+
+class JobLatest(models.Model):
+    uid = models.CharField(max_length=64, primary_key=True)
+    id = models.CharField(max_length=64)
+    version = models.IntegerField()
+    status = models.CharField(max_length=32)
+    rate = models.FloatField()
+    title = models.CharField(max_length=255)
+    company_id = models.CharField(max_length=64)
+    contractor_id = models.CharField(max_length=64)
+
+    class Meta:
+        managed = False
+        db_table = 'jobs_latest'
+
+    def __str__(self):
+        return f"{self.title} ({self.uid})"
+
+
+class TimelogLatest(models.Model):
+    uid = models.CharField(max_length=64, primary_key=True)
+    id = models.CharField(max_length=64)
+    version = models.IntegerField()
+    duration = models.FloatField()
+    time_start = models.DateTimeField()
+    time_end = models.DateTimeField()
+    type = models.CharField(max_length=32)
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.DO_NOTHING,
+        to_field='uid',
+        db_column='job_uid',
+        db_constraint=False,
+        related_name='+'
+    )
+
+    class Meta:
+        managed = False
+        db_table = 'timelogs_latest'
+
+    def __str__(self):
+        return f"Timelog {self.uid}"
+
+
+class PaymentLineItemLatest(models.Model):
+    uid = models.CharField(max_length=64, primary_key=True)
+    id = models.CharField(max_length=64)
+    version = models.IntegerField()
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.DO_NOTHING,
+        to_field='uid',
+        db_column='job_uid',
+        db_constraint=False,
+        related_name='+'
+    )
+    timelog = models.ForeignKey(
+        Timelog,
+        on_delete=models.DO_NOTHING,
+        to_field='uid',
+        db_column='timelog_uid',
+        db_constraint=False,
+        related_name='+'
+    )
+    amount = models.FloatField()
+    status = models.CharField(max_length=32)
+
+    class Meta:
+        managed = False
+        db_table = 'payment_line_items_latest'
 
     def __str__(self):
-        return f"PaymentLineItem {self.uid}"
\ No newline at end of file
+        return f"PaymentLineItem {self.uid}"
+
+
+register_latest_view(Job, JobLatest)
+register_latest_view(Timelog, TimelogLatest)
+register_latest_view(PaymentLineItem, PaymentLineItemLatest)
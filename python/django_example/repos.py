@@ -3,11 +3,15 @@ from .scd.scd_helpers import latest_scd_queryset
 
 def find_active_jobs_by_company(company_id):
     qs = latest_scd_queryset(Job)
-    return qs.filter(status='active', company_id=company_id)
+    return qs.filter(status='active', company_id=company_id).values(
+        'uid', 'id', 'version', 'title', 'rate'
+    )
 
 def find_active_jobs_by_contractor(contractor_id):
     qs = latest_scd_queryset(Job)
-    return qs.filter(status='active', contractor_id=contractor_id)
+    return qs.filter(status='active', contractor_id=contractor_id).values(
+        'uid', 'id', 'version', 'title', 'rate'
+    )
 
 def find_timelogs_by_contractor_and_period(contractor_id, from_dt, to_dt):
     qs = latest_scd_queryset(Timelog)
@@ -15,6 +19,8 @@ def find_timelogs_by_contractor_and_period(contractor_id, from_dt, to_dt):
         job__contractor_id=contractor_id,
         time_start__gte=from_dt,
         time_end__lte=to_dt
+    ).select_related('job').only(
+        'uid', 'id', 'version', 'time_start', 'time_end', 'job__contractor_id'
     )
 
 def find_line_items_by_contractor_and_period(contractor_id, from_dt, to_dt):
@@ -23,4 +29,7 @@ def find_line_items_by_contractor_and_period(contractor_id, from_dt, to_dt):
         job__contractor_id=contractor_id,
         timelog__time_start__gte=from_dt,
         timelog__time_end__lte=to_dt
+    ).select_related('job', 'timelog').only(
+        'uid', 'id', 'version', 'amount', 'status',
+        'job__contractor_id', 'timelog__time_start', 'timelog__time_end'
     )
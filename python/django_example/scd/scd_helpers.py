@@ -1,30 +1,91 @@
 
+import uuid
 
-from django.db.models import Max, OuterRef, Subquery
+from django.db import connection
+from django.db.models import Model
+
+# Base SCD model -> unmanaged model over its "latest versions" view
+_latest_views = {}
+
+def register_latest_view(model, view_model):
+    """
+    Serves latest_scd_queryset(model) from view_model, an unmanaged model over a
+    plain view selecting the latest version of each record. The view is evaluated
+    on every read, so it always reflects writes made through any code path.
+    """
+    _latest_views[model] = view_model
 
 def latest_scd_queryset(model, base_queryset=None):
     """
     Returns a queryset for the latest version of each SCD record in the given model.
     """
-    base_queryset = base_queryset or model.objects.all()
-    subq = (
+    view_model = _latest_views.get(model)
+    if view_model is not None:
+        qs = view_model.objects.all()
+        if base_queryset is not None:
+            qs = qs.filter(pk__in=base_queryset.values('pk'))
+        return qs
+    if base_queryset is None:
+        base_queryset = model.objects.all()
+    # DISTINCT ON (id) ... ORDER BY id, version DESC picks every record's latest
+    # version in a single pass instead of a correlated MAX(version) per row.
+    latest_pks = (
         model.objects
-        .filter(id=OuterRef('id'))
-        .values('id')
-        .annotate(max_version=Max('version'))
-        .values('max_version')
+        .order_by('id', '-version')
+        .distinct('id')
+        .values('pk')
     )
-    return base_queryset.filter(version=Subquery(subq))
+    return base_queryset.filter(pk__in=latest_pks)
 
-def create_new_scd_version(model, id, update_fn):
-    latest = model.objects.filter(id=id).order_by('-version').first()
-    if not latest:
+def create_new_scd_version(model, id, updates):
+    """
+    Inserts the next version of record id with the given {field name: value}
+    updates applied (foreign keys by instance or by their _id attribute),
+    copying the latest version server-side in one INSERT ... SELECT ...
+    RETURNING round-trip.
+    """
+    meta = model._meta
+    qn = connection.ops.quote_name
+    fields = meta.concrete_fields
+    # The record id, version and primary key identify the new row; changing id
+    # would fork the record, so these are never taken from updates
+    managed = {'id', 'version', meta.pk.name, meta.pk.attname}
+    known = {field.name for field in fields} | {field.attname for field in fields}
+    for key in updates:
+        if key in managed:
+            raise ValueError(f"{key!r} is managed by the SCD helper and cannot be updated")
+        if key not in known:
+            raise ValueError(f"{model.__name__} has no field {key!r}")
+    select_exprs = []
+    params = []
+    for field in fields:
+        if field.primary_key:
+            select_exprs.append('%s')
+            params.append(uuid.uuid4().hex)
+        elif field.name == 'version':
+            select_exprs.append(f"{qn(field.column)} + 1")
+        elif field.name in updates or field.attname in updates:
+            value = updates[field.name] if field.name in updates else updates[field.attname]
+            if field.is_relation and isinstance(value, Model):
+                value = getattr(value, field.target_field.attname)
+            select_exprs.append('%s')
+            params.append(field.get_db_prep_save(value, connection))
+        else:
+            select_exprs.append(qn(field.column))
+    params.append(id)
+    columns = ', '.join(qn(field.column) for field in fields)
+    table = qn(meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({columns}) "
+            f"SELECT {', '.join(select_exprs)} FROM {table} "
+            f"WHERE {qn(meta.get_field('id').column)} = %s "
+            f"ORDER BY {qn(meta.get_field('version').column)} DESC LIMIT 1 "
+            f"RETURNING {columns}",
+            params,
+        )
+        row = cursor.fetchone()
+    if not row:
         raise Exception("Not found")
-    new_version = model.objects.get(pk=latest.pk)
-    new_version.pk = None
-    new_version.version += 1
-    update_fn(new_version)
-    new_version.save()
-    return new_version
+    return model.from_db(connection.alias, [field.attname for field in fields], row)
 
- 
\ No newline at end of file